@@ -3,12 +3,45 @@ Agent Workflow Framework
 -----------------------
 
 A framework for creating agent-like workflow nodes with instructions, tools, and guardrails.
+
+Public symbols are imported lazily (PEP 562) so that `import
+agent_workflow_framework` does not pull in langgraph and the provider SDKs
+until the corresponding symbol is actually used.
 """
 
-from .core.graphs.elements import AgentNode
-from .core.graphs.states import NodeState
-from .core.llm.factory import ModelFactory
-from .core.llm.providers import ProviderType, allowed_models
-from .core.prompts.managers import PromptManager
+import importlib
+
+from .config import USE_LLM_CACHE
+
+# 公開シンボル -> 定義モジュール（初回アクセス時にimportされる）
+_EXPORTS = {
+    "AgentNode": ".core.graphs.elements",
+    "NodeState": ".core.graphs.states",
+    "ModelFactory": ".core.llm.factory",
+    "ProviderType": ".core.llm.providers",
+    "allowed_models": ".core.llm.providers",
+    "PromptManager": ".core.prompts.managers",
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name):
+    if name in _EXPORTS:
+        module = importlib.import_module(_EXPORTS[name], __name__)
+        value = getattr(module, name)
+        globals()[name] = value  # 2回目以降は通常の属性アクセスで解決される
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
+
+
+if USE_LLM_CACHE:
+    from .core.llm.cache import enable_llm_cache
+
+    enable_llm_cache()
 
 __version__ = "0.1.0"
@@ -11,5 +11,6 @@ LANGFUSE_SECRET_KEY = os.getenv("LANGFUSE_SECRET_KEY", "")
 LANGFUSE_PUBLIC_KEY = os.getenv("LANGFUSE_PUBLIC_KEY", "")
 LANGFUSE_HOST = os.getenv("LANGFUSE_HOST", "http://localhost:3000")
 USE_LANGFUSE = bool(os.getenv("USE_LANGFUSE", False))
+USE_LLM_CACHE = bool(os.getenv("USE_LLM_CACHE", False))
 
 DEBUG_MODE = False
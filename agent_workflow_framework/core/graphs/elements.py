@@ -1,9 +1,11 @@
 import logging
-from typing import Callable, Generic, Tuple, TypeVar
+from typing import Callable, Generic, List, Optional, Tuple, TypeVar
 
+from langchain_core.messages import HumanMessage
+from langchain_core.runnables import RunnableLambda
 from langgraph.graph import END
 
-from ...config import DEBUG_MODE
+from ...config import DEBUG_MODE, LANGCHAIN_MAX_CONCURRENCY
 from .states import NodeState
 
 logger = logging.getLogger(__name__)
@@ -13,9 +15,33 @@ T = TypeVar("T", bound="NodeState")
 
 class AgentNode(Generic[T]):
     name: str = "to be setup"
+    instruction: str = ""
 
     def __init__(self, llm) -> None:
         self.llm = llm
+        # nameはクラス属性で固定なので、langgraph用のノード名はここで確定できる
+        self._node_name = self.name.replace(" ", "_")
+
+    def run_with_instruction(self, text: str, cache_prefix: Optional[str] = None):
+        """
+        instructionを前置してLLMを呼び出す。
+
+        cache_prefix（省略時はinstruction）は共有プレフィックスとして
+        プロバイダのget_instruction_objectでマークされる。Anthropicでは
+        cache_control=ephemeralが付き、サーバ側のプロンプトキャッシュにより
+        同じ前置きを繰り返すノード群のTTFTを削減できる。
+        """
+        prefix = cache_prefix if cache_prefix is not None else self.instruction
+        get_block = getattr(self.llm, "get_instruction_object", None)
+        if get_block is None:
+            # プレフィックスのマークに対応しないLLMは単純な連結にフォールバック
+            result = self.llm.invoke(f"{prefix}:\n{text}")
+        else:
+            message = HumanMessage(
+                content=[get_block(prefix), {"type": "text", "text": text}]
+            )
+            result = self.llm.invoke([message])
+        return getattr(result, "content", result)
 
     def action(self, state: T) -> T:
         try:
@@ -29,6 +55,13 @@ class AgentNode(Generic[T]):
                 raise e
             return state.emit_error(f"An error occured during {self.name}: {str(e)}")
 
+    def action_batch(self, states: List[T]) -> List[T]:
+        """独立したstate群に対してactionを並列実行する"""
+        runnable = RunnableLambda(self.action)
+        return runnable.batch(
+            states, config={"max_concurrency": LANGCHAIN_MAX_CONCURRENCY}
+        )
+
     def proc(self, state: T) -> T:
         pass
 
@@ -39,11 +72,13 @@ class AgentNode(Generic[T]):
         return self.node_name, self.action
 
     @property
-    def node_name(cls) -> str:
-        return cls.name.replace(" ", "_")
+    def node_name(self) -> str:
+        return self._node_name
 
 
 class LangGraphConditionalEdge:
+    __slots__ = ("source", "target")
+
     def __init__(self, src: AgentNode, tgt: AgentNode):
         self.source = src
         self.target = tgt
@@ -1,29 +1,214 @@
+import functools
 from typing import List
 
-from core.graphs.elements import AgentNode, LangGraphConditionalEdge
+from langgraph.constants import Send
 from langgraph.graph import END, START, StateGraph
 
+from .elements import AgentNode, LangGraphConditionalEdge
+
+
+# 条件関数はどのエッジでも同一なので、boundメソッド参照を毎回作らず共有する
+_CHECK_ERROR = LangGraphConditionalEdge.check_error
+
+
+@functools.lru_cache(maxsize=None)
+def _edge_map(target_name: str) -> dict:
+    """{"error": END, "continue": target} の辞書を遷移先ごとに共有する"""
+    return {"error": END, "continue": target_name}
+
 
 class SequentialWorkflow:
+    __slots__ = ("workflow", "nodes", "_node_index", "_compiled")
+
     def __init__(self, nodes: List[AgentNode], init_state_cls) -> None:
         self.workflow = StateGraph(init_state_cls)
+        self.nodes = []
+        # ノード名 -> self.nodes内の位置。存在チェックをO(1)にするための索引
+        self._node_index = {}
+        self._compiled = None
         self.setup(nodes)
 
     def setup(self, nodes: List[AgentNode]) -> None:
-        nodes_with_sentinels = [START] + nodes + [END]
-        edges = [
-            LangGraphConditionalEdge(s, t)
-            for s, t in zip(nodes_with_sentinels, nodes_with_sentinels[1:])
-        ]
-        for e in edges:
-            if e.target == END:
-                self.workflow.add_edge(e.source.node_name, END)
-                continue
-            self.workflow.add_node(*e.target.generate_node())
-            if e.source == START:
-                self.workflow.set_entry_point(e.target.node_name)
+        # エッジオブジェクトのリストを作らず、1パスでノードとエッジを登録する
+        prev = START
+        for node in nodes:
+            self.workflow.add_node(*node.generate_node())
+            if prev == START:
+                self.workflow.set_entry_point(node.node_name)
             else:
-                self.workflow.add_conditional_edges(*e.args_conditional_edge())
+                self.workflow.add_conditional_edges(
+                    prev.node_name, _CHECK_ERROR, _edge_map(node.node_name)
+                )
+            prev = node
+        self.workflow.add_edge(prev.node_name, END)
+        for node in nodes:
+            self._node_index[node.node_name] = len(self.nodes)
+            self.nodes.append(node)
+
+    def add_node(self, node: AgentNode) -> None:
+        """末尾にノードを追加する。グラフは作り直さず差分だけを適用する"""
+        if node.node_name in self._node_index:
+            raise ValueError(f"Node '{node.node_name}' is already registered.")
+        self.workflow.add_node(*node.generate_node())
+        if not self.nodes:
+            self.workflow.set_entry_point(node.node_name)
+        else:
+            prev = self.nodes[-1]
+            # 旧末尾ノードのprev->ENDエッジを条件付きエッジに付け替える
+            self.workflow.edges.discard((prev.node_name, END))
+            self.workflow.add_conditional_edges(
+                prev.node_name, _CHECK_ERROR, _edge_map(node.node_name)
+            )
+        self.workflow.add_edge(node.node_name, END)
+        self._node_index[node.node_name] = len(self.nodes)
+        self.nodes.append(node)
+        self._compiled = None
+
+    def get_app(self, **compile_kwargs):
+        """
+        Compile the workflow into a runnable app.
+
+        デフォルト（引数なし）はcheckpointerなしのステートレス構成で、
+        superstepごとのチャネル永続化が発生しない。再開・リプレイが必要な
+        呼び出し側は `get_app(checkpointer=mc)` のようにcompile引数を渡す。
+        """
+        if compile_kwargs:
+            # checkpointer等で挙動が変わるため、引数付きはキャッシュしない
+            return self.workflow.compile(**compile_kwargs)
+        # compile結果（Pregelの検証・配線込み）は使い回せるのでキャッシュする
+        if self._compiled is None:
+            self._compiled = self.workflow.compile()
+        return self._compiled
+
+
+class ConditionalWorkflow:
+    """
+    条件分岐付きのワークフロー。
+
+    conditional_edgesは {ノード名: {"condition": 呼び出し可能オブジェクト,
+    "destinations": {ラベル: 遷移先ノード名 または "end"}}} の形式。
+    conditional_edgesに載っていないノードは、通常のエラーチェック付きで
+    リスト順の次ノードへ進む。
+    """
+
+    __slots__ = (
+        "workflow",
+        "init_state_cls",
+        "nodes",
+        "conditional_edges",
+        "_node_index",
+        "_compiled",
+        "_dirty",
+    )
+
+    def __init__(
+        self, nodes: List[AgentNode], init_state_cls, conditional_edges=None
+    ) -> None:
+        self.init_state_cls = init_state_cls
+        self.nodes = list(nodes)
+        self.conditional_edges = dict(conditional_edges) if conditional_edges else {}
+        self._node_index = {n.node_name: i for i, n in enumerate(self.nodes)}
+        self._compiled = None
+        self._dirty = False
+        self._setup()
+
+    def _setup(self) -> None:
+        # ノード登録と配線を1パスで行う。次ノードはリスト順に決まるので
+        # conditional_edges側・nodes側を別々に走査する必要はない
+        self.workflow = StateGraph(self.init_state_cls)
+        for node in self.nodes:
+            self.workflow.add_node(*node.generate_node())
+        self.workflow.set_entry_point(self.nodes[0].node_name)
+        last_index = len(self.nodes) - 1
+        for i, node in enumerate(self.nodes):
+            edge = self.conditional_edges.get(node.node_name)
+            if edge is not None:
+                destinations = {
+                    label: END if target == "end" else target
+                    for label, target in edge["destinations"].items()
+                }
+                self.workflow.add_conditional_edges(
+                    node.node_name, edge["condition"], destinations
+                )
+            elif i == last_index:
+                self.workflow.add_edge(node.node_name, END)
+            else:
+                self.workflow.add_conditional_edges(
+                    node.node_name, _CHECK_ERROR, _edge_map(self.nodes[i + 1].node_name)
+                )
+
+    def add_node(self, node: AgentNode) -> None:
+        """ノードを末尾に追加する。グラフ再構築はget_appまで遅延される"""
+        if node.node_name in self._node_index:
+            raise ValueError(f"Node '{node.node_name}' is already registered.")
+        self._node_index[node.node_name] = len(self.nodes)
+        self.nodes.append(node)
+        self._dirty = True
+
+    def add_conditional_edge(self, source_name: str, condition, destinations) -> None:
+        """条件分岐エッジを追加・更新する。グラフ再構築はget_appまで遅延される"""
+        if source_name not in self._node_index:
+            raise ValueError(f"Node '{source_name}' is not registered.")
+        self.conditional_edges[source_name] = {
+            "condition": condition,
+            "destinations": destinations,
+        }
+        self._dirty = True
+
+    def get_app(self, **compile_kwargs):
+        """
+        Compile the workflow into a runnable app.
+
+        デフォルトはcheckpointerなしのステートレス構成。再開・リプレイが
+        必要な場合は `get_app(checkpointer=mc)` のようにcompile引数を渡す。
+        """
+        # 編集をまとめて反映する。連続したadd_node/add_conditional_edgeは
+        # ここで1回の再構築・compileになる
+        if self._dirty:
+            self._setup()
+            self._compiled = None
+            self._dirty = False
+        if compile_kwargs:
+            # checkpointer等で挙動が変わるため、引数付きはキャッシュしない
+            return self.workflow.compile(**compile_kwargs)
+        if self._compiled is None:
+            self._compiled = self.workflow.compile()
+        return self._compiled
+
+
+class ParallelWorkflow:
+    """
+    互いに依存しないノード群をfan-out/fan-inで並列実行するワークフロー。
+
+    直列実行ではN個のLLM呼び出しのレイテンシが合計になるのに対し、
+    SendによるディスパッチでmaxまでLLM待ちを縮められる。並列に書き込まれる
+    stateのフィールドには `Annotated[list, operator.add]` などのreducerを
+    定義しておくこと（そうでないと同時書き込みが衝突する）。
+    """
+
+    __slots__ = ("workflow", "nodes", "_compiled")
+
+    def __init__(self, nodes: List[AgentNode], init_state_cls) -> None:
+        self.workflow = StateGraph(init_state_cls)
+        self.nodes = list(nodes)
+        self._compiled = None
+        self.setup(self.nodes)
+
+    def setup(self, nodes: List[AgentNode]) -> None:
+        for node in nodes:
+            self.workflow.add_node(*node.generate_node())
+            self.workflow.add_edge(node.node_name, END)
+        targets = [node.node_name for node in nodes]
+        self.workflow.add_conditional_edges(
+            START,
+            lambda state, _targets=targets: [Send(t, state) for t in _targets],
+            targets,
+        )
 
-    def get_app(self):
-        return self.workflow.compile()
+    def get_app(self, **compile_kwargs):
+        if compile_kwargs:
+            # checkpointer等で挙動が変わるため、引数付きはキャッシュしない
+            return self.workflow.compile(**compile_kwargs)
+        if self._compiled is None:
+            self._compiled = self.workflow.compile()
+        return self._compiled
@@ -1,8 +1,15 @@
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class NodeState(BaseModel):
+    # ノードは state.field = ... を多用するので、代入ごとのフル検証は行わない
+    # （validate_assignment=Trueにすると全ノードの書き込みが重くなる）。
+    # extra="forbid"で未定義フィールドへの入力は構築時に弾く。
+    model_config = ConfigDict(validate_assignment=False, extra="forbid")
+
     error: str = Field(default="")  # エラーメッセージ（存在する場合）
 
     def emit_error(self, error_str):
-        return self.model_copy(update={"error": error_str})
+        # errorフィールドだけ差し替えるのでvalidation付きのmodel_copyは不要。
+        # model_constructで浅いコピーを作り、他フィールドは参照を共有する。
+        return self.__class__.model_construct(**{**self.__dict__, "error": error_str})
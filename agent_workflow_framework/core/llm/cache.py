@@ -0,0 +1,47 @@
+"""
+Persistent prompt/response cache for language models.
+
+All provider classes derive from langchain chat models, so they honor the
+process-global cache installed via ``set_llm_cache``. Enabling it makes
+repeated identical completions a local lookup instead of an API call.
+"""
+
+import logging
+import os
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CACHE_DB = os.path.join(
+    os.path.expanduser("~"), ".cache", "agent_workflow_framework", "llm_cache.sqlite"
+)
+
+
+def enable_llm_cache(database_path: str = None) -> None:
+    """
+    Install a process-global LLM response cache.
+
+    Uses a SQLite-backed cache so responses survive across runs; falls back
+    to an in-memory cache when langchain_community is not installed.
+
+    Args:
+        database_path: Path of the SQLite file (defaults to AWF_LLM_CACHE_DB
+            or ~/.cache/agent_workflow_framework/llm_cache.sqlite)
+    """
+    from langchain_core.globals import set_llm_cache
+
+    if database_path is None:
+        database_path = os.getenv("AWF_LLM_CACHE_DB", DEFAULT_CACHE_DB)
+    try:
+        from langchain_community.cache import SQLiteCache
+    except ImportError:
+        # langchain_communityが無い環境ではプロセス内キャッシュにフォールバック
+        from langchain_core.caches import InMemoryCache
+
+        logger.warning(
+            "langchain_community is not installed; using InMemoryCache "
+            "instead of a persistent SQLiteCache."
+        )
+        set_llm_cache(InMemoryCache())
+        return
+    os.makedirs(os.path.dirname(database_path), exist_ok=True)
+    set_llm_cache(SQLiteCache(database_path=database_path))
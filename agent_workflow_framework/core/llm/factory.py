@@ -1,4 +1,5 @@
-from typing import Dict, Type
+import functools
+from typing import Dict, Tuple, Type
 
 from .models import UnifiedModel
 from .providers import get_provider, model_registry
@@ -15,15 +16,47 @@ class ModelFactory:
     # Registry of provider-specific model implementations
     _registry: Dict[str, Type[UnifiedModel]] = model_registry
 
+    # 同一設定で作られたインスタンスを再利用するためのキャッシュ
+    _instance_cache: Dict[Tuple, UnifiedModel] = {}
+
+    @classmethod
+    @functools.lru_cache(maxsize=256)
+    def _resolve(cls, model_name: str, provider_name: str = None) -> Type[UnifiedModel]:
+        """
+        Resolve (model_name, provider_name) to the implementation class.
+
+        Memoized so repeated creation of the same model skips provider
+        detection and the registry lookup entirely.
+        """
+        provider = get_provider(model_name) if provider_name is None else provider_name
+        model_class = cls._registry.get(provider)
+        if model_class is None:
+            raise ValueError(
+                f"Provider '{provider}' is not registered. "
+                f"Available providers: {list(cls._registry.keys())}"
+            )
+        return model_class
+
     @classmethod
     def create(
-        cls, model_name: str, provider_name: str = None, **kwargs
+        cls,
+        model_name: str,
+        provider_name: str = None,
+        cache: bool = True,
+        **kwargs,
     ) -> UnifiedModel:
         """
         Create a model instance for the specified model name.
 
+        Instances are cached by (model_name, provider, kwargs), so creating
+        the same model twice returns the same object and reuses its
+        underlying HTTP client instead of rebuilding it. Models with
+        unhashable kwargs are constructed fresh each time.
+
         Args:
             model_name: Name of the model
+            cache: When False, the model opts out of the process-global LLM
+                response cache (see core.llm.cache.enable_llm_cache)
             **kwargs: Additional arguments for the model
 
         Returns:
@@ -32,12 +65,24 @@ class ModelFactory:
         Raises:
             ValueError: If the provider is not supported or not registered
         """
-        provider = get_provider(model_name) if provider_name is None else provider_name
+        if not cache:
+            # langchainのチャットモデルはcache=Falseでグローバルキャッシュを無視する
+            kwargs["cache"] = False
 
-        if provider not in cls._registry:
-            raise ValueError(
-                f"Provider '{provider}' is not registered. "
-                f"Available providers: {list(cls._registry.keys())}"
-            )
-        model_class = cls._registry[provider]
-        return model_class(model_name, **kwargs)
+        model_class = cls._resolve(model_name, provider_name)
+        try:
+            key = (model_name, model_class, frozenset(kwargs.items()))
+            cached = cls._instance_cache.get(key)
+        except TypeError:
+            # kwargsにハッシュ不可能な値が含まれる場合はキャッシュ対象外
+            return model_class(model_name, **kwargs)
+        if cached is None:
+            cached = cls._instance_cache[key] = model_class(model_name, **kwargs)
+        return cached
+
+    @classmethod
+    def clear_cache(cls) -> None:
+        """
+        Drop all cached model instances (mainly for test isolation).
+        """
+        cls._instance_cache.clear()
@@ -5,17 +5,28 @@ This module provides the base classes and interfaces for working with different
 language model providers in a unified way.
 """
 
-from abc import ABC
+from typing import Protocol, runtime_checkable
 
 
-class UnifiedModel(ABC):
+@runtime_checkable
+class UnifiedModel(Protocol):
+    """
+    Structural interface every provider model implements.
+
+    Defined as a Protocol rather than an ABC so provider classes (which
+    inherit from langchain's pydantic chat models) need no extra base class
+    in their MRO; conformance is checked structurally.
+    """
 
     @property
     def provider_name(self) -> str:
         """
         Returns the name of the model provider.
         """
-        pass
+        ...
 
     def get_image_object(self, image_path) -> dict:
-        pass
+        ...
+
+    def get_instruction_object(self, instruction: str) -> dict:
+        ...
@@ -1,3 +1,9 @@
+"""
+Provider-specific implementations of the unified model interface.
+"""
+
+import functools
+from concurrent.futures import ThreadPoolExecutor
 from enum import Enum
 from typing import Dict, Type
 
@@ -14,10 +20,6 @@ _providers = [
     openai.get_provider_info(),
 ]
 
-"""
-Provider-specific implementations of the unified model interface.
-"""
-
 # ProviderType Enumを作成
 ProviderType = Enum("ProviderType", {p["name"].upper(): p["name"] for p in _providers})
 
@@ -26,14 +28,37 @@ model_registry: Dict[str, Type[UnifiedModel]] = {
     p["name"]: p["model_class"] for p in _providers
 }
 
-# ToDo: 毎回起動のたびにmodel listのAPIが呼ばれるのは良くないのでキャッシュ機構を検討すること。
+# model listはLazyModelList経由で初回利用時に取得され、ディスクキャッシュされる（_cache.py参照）
 allowed_models = {p["name"]: p["custom_models"] for p in _providers}
 
 
+def prefetch_models() -> None:
+    """
+    Fetch every provider's model list concurrently.
+
+    Each list is lazy and would otherwise be fetched sequentially on first
+    use; prefetching makes a cold start cost max(provider latency) instead
+    of the sum. With a warm disk cache this returns almost immediately.
+    """
+    with ThreadPoolExecutor(max_workers=len(_providers)) as executor:
+        # executor.mapで_providersの順序（get_providerの優先順位）はそのまま保たれる
+        list(executor.map(list, (p["custom_models"] for p in _providers)))
+
+
+# get_providerが毎回dictを引かずに済むよう、(name, prefix, custom_models)をタプル化しておく
+_provider_lookup = tuple(
+    (p["name"], p["model_prefix"], p["custom_models"]) for p in _providers
+)
+
+
+@functools.lru_cache(maxsize=None)
 def get_provider(model_name: str) -> str:
     """
     Determine the provider from the model name.
 
+    Results are memoized, so repeated lookups for the same model name are a
+    single dict probe instead of a scan over every provider.
+
     Args:
         model_name: Name of the model
 
@@ -43,14 +68,11 @@ def get_provider(model_name: str) -> str:
     Raises:
         ValueError: If the provider cannot be determined
     """
-    for p in _providers:
-        provider = p["name"]
+    for provider, prefix, custom_models in _provider_lookup:
         # 接頭辞でチェック
-        prefix = p["model_prefix"]
         if prefix is not None and model_name.startswith(prefix):
             return provider
         # カスタムモデルでチェック
-        custom_models = p["custom_models"]
         if model_name in custom_models:
             return provider
 
@@ -0,0 +1,90 @@
+"""
+Disk cache for provider model lists.
+
+Each provider fetches its available-model list from a remote API. Doing that
+at import time means every process start pays one HTTP round trip per
+provider. The helpers here cache the fetched ids in a small JSON file per
+provider (with a TTL) and defer the fetch until the list is actually used.
+"""
+
+import json
+import os
+import time
+from typing import Callable, Iterator, List, Optional
+
+# キャッシュの保存先とTTL（環境変数で上書き可能）
+CACHE_DIR = os.getenv(
+    "AWF_MODEL_CACHE_DIR",
+    os.path.join(os.path.expanduser("~"), ".cache", "agent_workflow_framework"),
+)
+DEFAULT_TTL = int(os.getenv("AWF_MODEL_CACHE_TTL", 86400))
+
+
+def _cache_path(provider_name: str) -> str:
+    return os.path.join(CACHE_DIR, f"{provider_name}.json")
+
+
+def cached_models(
+    provider_name: str, fetch_fn: Callable[[], List[str]], ttl: int = DEFAULT_TTL
+) -> List[str]:
+    """
+    Return the model list for a provider, using the disk cache when fresh.
+
+    Args:
+        provider_name: Provider name, used as the cache key
+        fetch_fn: Function performing the real API call
+        ttl: Cache lifetime in seconds
+
+    Returns:
+        List of model ids
+    """
+    path = _cache_path(provider_name)
+    try:
+        if time.time() - os.path.getmtime(path) < ttl:
+            with open(path, encoding="utf-8") as f:
+                return json.load(f)
+    except (OSError, ValueError):
+        pass
+    models = fetch_fn()
+    if models:
+        try:
+            os.makedirs(CACHE_DIR, exist_ok=True)
+            tmp_path = path + ".tmp"
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(models, f)
+            os.replace(tmp_path, path)  # 書き込み途中のファイルを見せないためatomicに置換
+        except OSError:
+            pass
+    return models
+
+
+class LazyModelList:
+    """
+    List-like proxy that fetches a provider's model list on first use.
+
+    Module import stays free of network I/O; iteration and membership tests
+    trigger a single (disk-cached) fetch.
+    """
+
+    def __init__(self, provider_name: str, fetch_fn: Callable[[], List[str]]) -> None:
+        self.provider_name = provider_name
+        self.fetch_fn = fetch_fn
+        self._models: Optional[List[str]] = None
+
+    def _load(self) -> List[str]:
+        if self._models is None:
+            self._models = cached_models(self.provider_name, self.fetch_fn)
+        return self._models
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._load())
+
+    def __contains__(self, model_name: object) -> bool:
+        return model_name in self._load()
+
+    def __len__(self) -> int:
+        return len(self._load())
+
+    def __repr__(self) -> str:
+        loaded = "..." if self._models is None else repr(self._models)
+        return f"LazyModelList({self.provider_name}, {loaded})"
@@ -2,29 +2,35 @@
 Anthropic Claude model implementation.
 """
 
-from anthropic import Anthropic
+import logging
+import sys
+
+from anthropic import Anthropic, AnthropicError
 from langchain_anthropic import ChatAnthropic
 
-from ..models import UnifiedModel
 from ..utils import image_path_to_image_data
+from ._cache import LazyModelList
+
+logger = logging.getLogger(__name__)
 
-provider_name = "anthropic"
+provider_name = sys.intern("anthropic")  # 等値比較をポインタ比較で済ませるためintern
 model_prefix = "claude-"
 
 
 def get_available_models():
-    client = Anthropic()
     try:
+        client = Anthropic()
         data = client.models.list().data
         return [d.id for d in data if d.type == "model"]
-    except:
+    except AnthropicError as e:
+        logger.debug("anthropic model list fetch failed: %s", e)
         return []
 
 
-provided_models = get_available_models()
+provided_models = LazyModelList(provider_name, get_available_models)
 
 
-class AnthropicModel(ChatAnthropic, UnifiedModel):
+class AnthropicModel(ChatAnthropic):
     """
     Implementation of the unified model interface for Anthropic Claude models.
     """
@@ -54,6 +60,15 @@ class AnthropicModel(ChatAnthropic, UnifiedModel):
             "source": {"type": "base64", "media_type": mime_type, "data": image_data},
         }
 
+    @staticmethod
+    def get_instruction_object(instruction: str) -> dict:
+        # cache_controlを付けると静的なinstructionがAnthropicのprompt cacheの対象になる
+        return {
+            "type": "text",
+            "text": instruction,
+            "cache_control": {"type": "ephemeral"},
+        }
+
 
 model_class = AnthropicModel
 
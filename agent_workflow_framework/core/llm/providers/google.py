@@ -2,34 +2,42 @@
 Google Gemini model implementation.
 """
 
+import logging
+import sys
+
 # langchain_google_genaiはgoogle-ai-generativelanguageを使っているが、移行が推奨されているためgoogle‑genai を使う
 from google import genai
+from google.genai import errors
 from langchain_google_genai import ChatGoogleGenerativeAI
 
-from ..models import UnifiedModel
 from ..utils import image_path_to_image_data
+from ._cache import LazyModelList
+
+logger = logging.getLogger(__name__)
 
-provider_name = "google"
+provider_name = sys.intern("google")  # 等値比較をポインタ比較で済ませるためintern
 model_prefix = "gemini-"
 
 
 def get_available_models():
-    client = genai.Client()
     try:
+        # Client()はAPIキー未設定だとValueErrorを投げるのでtry内で構築する
+        client = genai.Client()
         data = client.models.list()
         return [
             d.name[len("models/") :]
             for d in data
             if "generateContent" in d.supported_actions
         ]
-    except:
+    except (errors.APIError, ValueError) as e:
+        logger.debug("google model list fetch failed: %s", e)
         return []
 
 
-provided_models = get_available_models()
+provided_models = LazyModelList(provider_name, get_available_models)
 
 
-class GoogleModel(ChatGoogleGenerativeAI, UnifiedModel):
+class GoogleModel(ChatGoogleGenerativeAI):
     """
     Implementation of the unified model interface for Google Gemini models.
     """
@@ -59,6 +67,10 @@ class GoogleModel(ChatGoogleGenerativeAI, UnifiedModel):
             "image_url": {"url": f"data:{mime_type};base64,{image_data}"},
         }
 
+    @staticmethod
+    def get_instruction_object(instruction: str) -> dict:
+        return {"type": "text", "text": instruction}
+
 
 model_class = GoogleModel
 
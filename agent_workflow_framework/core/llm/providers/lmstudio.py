@@ -2,32 +2,48 @@
 OpenAI model implementation.
 """
 
+import atexit
+import logging
+import sys
+
 import httpx
+
+try:
+    import orjson  # あれば高速なJSONパーサを使う
+except ImportError:
+    orjson = None
 from langchain_openai import ChatOpenAI
 
 from ....config import LMSTUDIO_HOST
-from ..models import UnifiedModel
 from ..utils import image_path_to_image_data
+from ._cache import LazyModelList
 
-provider_name = "lmstudio"
+logger = logging.getLogger(__name__)
+
+provider_name = sys.intern("lmstudio")  # 等値比較をポインタ比較で済ませるためintern
 model_prefix = None
 
+# API呼び出しごとにClientを作り直さず、コネクションプールごと使い回す
+_client = httpx.Client(base_url=LMSTUDIO_HOST, timeout=5.0)
+atexit.register(_client.close)
+
 
 def get_available_models():
-    models_url = LMSTUDIO_HOST + "models"
-    with httpx.Client() as client:
-        try:
-            response = client.get(models_url)
-            data = response.json()
-            return [d["id"] for d in data["data"] if d["object"] == "model"]
-        except:
-            return []
+    try:
+        response = _client.get("models")
+        data = (
+            orjson.loads(response.content) if orjson is not None else response.json()
+        )
+        return [d["id"] for d in data["data"] if d["object"] == "model"]
+    except (httpx.HTTPError, KeyError, ValueError) as e:
+        logger.debug("lmstudio model list fetch failed: %s", e)
+        return []
 
 
-provided_models = get_available_models()
+provided_models = LazyModelList(provider_name, get_available_models)
 
 
-class LMStudioModel(ChatOpenAI, UnifiedModel):
+class LMStudioModel(ChatOpenAI):
     """
     Implementation of the unified model interface for OpenAI models.
     """
@@ -59,6 +75,10 @@ class LMStudioModel(ChatOpenAI, UnifiedModel):
             "image_url": {"url": f"data:{mime_type};base64,{image_data}"},
         }
 
+    @staticmethod
+    def get_instruction_object(instruction: str) -> dict:
+        return {"type": "text", "text": instruction}
+
 
 model_class = LMStudioModel
 
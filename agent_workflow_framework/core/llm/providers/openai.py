@@ -2,29 +2,35 @@
 OpenAI model implementation.
 """
 
+import logging
+import sys
+
 from langchain_openai import ChatOpenAI
-from openai import OpenAI
+from openai import OpenAI, OpenAIError
 
-from ..models import UnifiedModel
 from ..utils import image_path_to_image_data
+from ._cache import LazyModelList
+
+logger = logging.getLogger(__name__)
 
-provider_name = "openai"
+provider_name = sys.intern("openai")  # 等値比較をポインタ比較で済ませるためintern
 model_prefix = "gpt-"
 
 
 def get_available_models():
-    client = OpenAI()
     try:
+        client = OpenAI()
         data = client.models.list().data
         return [d.id for d in data if d.object == "model"]
-    except:
+    except OpenAIError as e:
+        logger.debug("openai model list fetch failed: %s", e)
         return []
 
 
-provided_models = get_available_models()
+provided_models = LazyModelList(provider_name, get_available_models)
 
 
-class OpenAIModel(ChatOpenAI, UnifiedModel):
+class OpenAIModel(ChatOpenAI):
     """
     Implementation of the unified model interface for OpenAI models.
     """
@@ -54,6 +60,10 @@ class OpenAIModel(ChatOpenAI, UnifiedModel):
             "image_url": {"url": f"data:{mime_type};base64,{image_data}"},
         }
 
+    @staticmethod
+    def get_instruction_object(instruction: str) -> dict:
+        return {"type": "text", "text": instruction}
+
 
 model_class = OpenAIModel
 
@@ -1,6 +1,8 @@
 import base64
+import functools
 import io
 import mimetypes
+import os
 
 from PIL import Image
 
@@ -18,7 +20,16 @@ def image_to_image_data_str(image):
         raise Exception(f"サポートされていない画像形式です (画像 {image})")
 
 
-def image_path_to_image_data(image_path):
+# 同じ画像を複数ノード・複数ターンで参照する場合に読み込みとbase64エンコードを省く
+@functools.lru_cache(maxsize=256)
+def _image_data_cached(image_path, mtime_ns, size):
     mime_type, _ = mimetypes.guess_type(image_path)
     image_data = image_to_image_data_str(image_path)
     return mime_type, image_data
+
+
+def image_path_to_image_data(image_path):
+    # (絶対パス, mtime, サイズ)をキーにするので、ファイルが書き換えられると
+    # 自動的にキャッシュミスになり再読み込みされる
+    st = os.stat(image_path)
+    return _image_data_cached(os.path.abspath(image_path), st.st_mtime_ns, st.st_size)
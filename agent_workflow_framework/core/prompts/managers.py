@@ -1,5 +1,5 @@
 import logging
-from copy import deepcopy
+from collections import OrderedDict
 from string import Formatter
 from typing import Self
 
@@ -9,6 +9,9 @@ from langchain_core.prompts import ChatPromptTemplate
 
 logger = logging.getLogger(__name__)
 
+# 構築済みChatPromptTemplateのLRUキャッシュ上限（PromptManagerごと）
+_TEMPLATE_CACHE_SIZE = 128
+
 
 def extract_variables_from(format_string):
     formatter = Formatter()
@@ -57,6 +60,9 @@ class PromptManager:
         self.attach_prefix = (
             "_attach_"  # DSLで_attach_　とついたkeyには添付で対応する。
         )
+        # (key, kwargs) -> 構築済みChatPromptTemplate。同じ引数での呼び出しは
+        # assign_varsの再帰的な再構築とテンプレート構築を省く
+        self._template_cache = OrderedDict()
 
     def __setitem__(self, key, value) -> None:
         """
@@ -72,6 +78,8 @@ class PromptManager:
                     "新しく設定するテンプレートは元のテンプレートと同一のformat変数を持たなくてはいけません。"
                 )
         self.prompt_contents[key] = value
+        # テンプレート本体が変わったので構築済みキャッシュは破棄する
+        self._template_cache.clear()
 
     def __getitem__(self, key: str) -> Self:
         key_ = self.get_item_logic(key)
@@ -94,15 +102,31 @@ class PromptManager:
             raise Exception(
                 f"{self.prompt_name}の呼び出しは、あらかじめ決められた引数が必要です。expected: {self.variables}, actual: {kws}"
             )
-        prompt_content = deepcopy(self.prompt_contents[self.default_key])
-        prompt_content = assign_vars(prompt_content, kwargs)
+        # 同じkey・同じ引数ならテンプレートも同一なのでキャッシュから返す
+        # （添付データなどhash化できない値を含む場合はキャッシュを素通りする）
+        try:
+            cache_key = (self.default_key, tuple(sorted(kwargs.items())))
+            cached = self._template_cache.get(cache_key)
+        except TypeError:
+            cache_key = None
+            cached = None
+        if cached is not None:
+            self._template_cache.move_to_end(cache_key)
+            return cached
+        # assign_varsはlist/dict/メッセージを新規構築して返すので、事前のdeepcopyは不要
+        prompt_content = assign_vars(self.prompt_contents[self.default_key], kwargs)
         attached_contents = []
         for k in kws:
             if k.startswith(self.attach_prefix):
                 attached_contents = self.attach(kwargs[k], attached_contents)
         if attached_contents:
             prompt_content += [HumanMessage(content=attached_contents)]
-        return ChatPromptTemplate(prompt_content)
+        template = ChatPromptTemplate(prompt_content)
+        if cache_key is not None:
+            self._template_cache[cache_key] = template
+            if len(self._template_cache) > _TEMPLATE_CACHE_SIZE:
+                self._template_cache.popitem(last=False)
+        return template
 
     @staticmethod
     def attach(image_info, content_list):
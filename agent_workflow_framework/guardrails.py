@@ -0,0 +1,345 @@
+"""
+Guardrails for validating and fixing node outputs.
+
+A guardrail checks an LLM output and, when it finds issues, rewrites the
+output into an acceptable form. Guardrails are grouped in a
+GuardrailRegistry and applied in registration order.
+"""
+
+import asyncio
+import bisect
+import json
+import re
+from collections import OrderedDict
+from hashlib import blake2b
+from typing import Any, Callable, Dict, List, Optional
+
+try:
+    import hyperscan  # あればマルチパターンを1パスで走査できる
+except ImportError:
+    hyperscan = None
+
+try:
+    import orjson  # あれば高速なJSONパーサを使う
+except ImportError:
+    orjson = None
+
+try:
+    from jsonschema import Draft202012Validator
+except ImportError:
+    Draft202012Validator = None
+
+
+class Guardrail:
+    """
+    Base class for all guardrails.
+    """
+
+    __slots__ = ("name", "description")
+
+    def __init__(self, name: str, description: str = "") -> None:
+        self.name = name
+        self.description = description
+
+    def validate(self, output: str) -> Dict[str, Any]:
+        """
+        Check an output.
+
+        Returns:
+            dict with keys "valid" (bool) and "issues" (list of dicts)
+        """
+        return {"valid": True, "issues": []}
+
+    def fix(self, output: str, issues: List[Dict[str, Any]]) -> str:
+        """
+        Rewrite an output so the reported issues are resolved.
+        """
+        return output
+
+    async def avalidate(self, output: str) -> Dict[str, Any]:
+        """validateの非同期版。デフォルトはスレッドに逃がすだけ"""
+        return await asyncio.to_thread(self.validate, output)
+
+    async def afix(self, output: str, issues: List[Dict[str, Any]]) -> str:
+        """fixの非同期版。LLMを呼ぶguardrailはこちらをoverrideする"""
+        return await asyncio.to_thread(self.fix, output, issues)
+
+    def validate_batch(self, outputs: List[str]) -> List[Dict[str, Any]]:
+        """validateの一括版。走査をamortizeできるサブクラスはこちらをoverrideする"""
+        return [self.validate(output) for output in outputs]
+
+    def fix_batch(
+        self, outputs: List[str], results: List[Dict[str, Any]]
+    ) -> List[str]:
+        """fixの一括版。validate_batchの結果に対応する出力列を返す"""
+        return [
+            output if result["valid"] else self.fix(output, result["issues"])
+            for output, result in zip(outputs, results)
+        ]
+
+
+class RegexGuardrail(Guardrail):
+    """
+    Guardrail that flags and redacts pattern matches.
+
+    Each pattern entry is a dict with keys "pattern", "action"
+    ("block" redacts matches in fix) and "message".
+    """
+
+    __slots__ = ("patterns", "_compiled", "_block_re", "_hs_db")
+
+    def __init__(
+        self, name: str, patterns: List[Dict[str, Any]], description: str = ""
+    ) -> None:
+        super().__init__(name, description)
+        self.patterns = patterns
+        # パターンは不変なので、呼び出しごとのre内部キャッシュ参照を避けて先にコンパイルする
+        self._compiled = [
+            (re.compile(p["pattern"], re.IGNORECASE), p) for p in patterns
+        ]
+        # "block"対象のパターンは1本の選択肢にまとめ、fixを出力1パスで済ませる
+        block_patterns = [
+            p["pattern"] for p in patterns if p.get("action", "block") == "block"
+        ]
+        self._block_re = (
+            re.compile("|".join(f"(?:{p})" for p in block_patterns), re.IGNORECASE)
+            if block_patterns
+            else None
+        )
+        # hyperscanがあれば全パターンを1つのDFAにまとめ、validateを1パスにする
+        self._hs_db = None
+        if hyperscan is not None and patterns:
+            try:
+                db = hyperscan.Database()
+                # SOM_LEFTMOSTがないとstartが常に0で報告され、validate_batchの
+                # オフセット振り分けが全ヒットを先頭のoutputに付けてしまう
+                db.compile(
+                    expressions=[p["pattern"].encode() for p in patterns],
+                    ids=list(range(len(patterns))),
+                    flags=[hyperscan.HS_FLAG_CASELESS | hyperscan.HS_FLAG_SOM_LEFTMOST]
+                    * len(patterns),
+                )
+                self._hs_db = db
+            except hyperscan.error:
+                # hyperscanが扱えない構文（後方参照など）はPython reのみで処理する
+                self._hs_db = None
+
+    def _matched_indices(self, output: str) -> List[int]:
+        """どのパターンがヒットしたかをhyperscanの1パス走査で求める"""
+        hit_ids = set()
+
+        def on_match(pattern_id, start, end, flags, context):
+            hit_ids.add(pattern_id)
+
+        self._hs_db.scan(output.encode(), match_event_handler=on_match)
+        return sorted(hit_ids)
+
+    def _build_issues(self, output: str, candidates) -> List[Dict[str, Any]]:
+        issues = []
+        for compiled, p in candidates:
+            matches = compiled.findall(output)
+            if matches:
+                issues.append(
+                    {
+                        "pattern": p["pattern"],
+                        "action": p.get("action", "block"),
+                        "message": p.get("message", ""),
+                        "matches": matches,
+                    }
+                )
+        return issues
+
+    def validate(self, output: str) -> Dict[str, Any]:
+        if self._hs_db is not None:
+            # ヒットしたパターンに対してだけPython reでマッチ内容を取り直す
+            candidates = [self._compiled[i] for i in self._matched_indices(output)]
+        else:
+            candidates = self._compiled
+        issues = self._build_issues(output, candidates)
+        return {"valid": not issues, "issues": issues}
+
+    def validate_batch(self, outputs: List[str]) -> List[Dict[str, Any]]:
+        if self._hs_db is None or not outputs:
+            return [self.validate(output) for output in outputs]
+        # 全出力をNUL区切りで連結して1回だけ走査し、オフセットで元のoutputに振り分ける
+        # （NULをまたいでマッチし得るパターンは想定しない）
+        encoded = [output.encode() for output in outputs]
+        offsets = []
+        position = 0
+        for e in encoded:
+            offsets.append(position)
+            position += len(e) + 1
+        hits = [set() for _ in outputs]
+
+        def on_match(pattern_id, start, end, flags, context):
+            hits[bisect.bisect_right(offsets, start) - 1].add(pattern_id)
+
+        self._hs_db.scan(b"\0".join(encoded), match_event_handler=on_match)
+        results = []
+        for output, hit_ids in zip(outputs, hits):
+            candidates = [self._compiled[i] for i in sorted(hit_ids)]
+            issues = self._build_issues(output, candidates)
+            results.append({"valid": not issues, "issues": issues})
+        return results
+
+    def fix(self, output: str, issues: List[Dict[str, Any]]) -> str:
+        if self._block_re is None or not any(
+            issue["action"] == "block" for issue in issues
+        ):
+            return output
+        # マッチしないblockパターンはsubに影響しないので、選択肢1本の置換で等価になる
+        return self._block_re.sub("[REDACTED]", output)
+
+
+class SchemaGuardrail(Guardrail):
+    """
+    Guardrail that validates an output as JSON against a JSON schema.
+
+    An optional fix_with_llm callable can rewrite invalid outputs (e.g. by
+    asking an LLM to repair the JSON).
+    """
+
+    __slots__ = ("schema", "fix_with_llm", "_validator")
+
+    def __init__(
+        self,
+        name: str,
+        schema: Dict[str, Any],
+        description: str = "",
+        fix_with_llm: Optional[Callable[[str, List[Dict[str, Any]]], str]] = None,
+    ) -> None:
+        super().__init__(name, description)
+        self.schema = schema
+        self.fix_with_llm = fix_with_llm
+        if Draft202012Validator is None:
+            raise ImportError(
+                "SchemaGuardrail requires the jsonschema package. "
+                "Install it with: pip install agent_workflow_framework[guardrails]"
+            )
+        # jsonschema.validateは呼び出しごとにvalidatorを作り直すので、ここで1度だけ構築する
+        Draft202012Validator.check_schema(schema)
+        self._validator = Draft202012Validator(schema)
+
+    def validate(self, output: str) -> Dict[str, Any]:
+        try:
+            data = orjson.loads(output) if orjson is not None else json.loads(output)
+        except ValueError as e:
+            return {"valid": False, "issues": [{"message": f"invalid JSON: {e}"}]}
+        issues = [{"message": e.message} for e in self._validator.iter_errors(data)]
+        return {"valid": not issues, "issues": issues}
+
+    def fix(self, output: str, issues: List[Dict[str, Any]]) -> str:
+        if self.fix_with_llm is not None:
+            return self.fix_with_llm(output, issues)
+        return output
+
+
+# validate結果のLRUキャッシュの上限エントリ数
+_RESULT_CACHE_SIZE = 1024
+
+
+class GuardrailRegistry:
+    """
+    Ordered collection of guardrails applied to one output.
+    """
+
+    __slots__ = ("_guardrails", "_names", "_validate_fns", "_fix_fns", "_result_cache")
+
+    def __init__(self) -> None:
+        self._guardrails: Dict[str, Guardrail] = {}
+        # applyループでdict走査とメソッド解決を繰り返さないための並行リスト
+        self._names: List[str] = []
+        self._validate_fns: List[Callable] = []
+        self._fix_fns: List[Callable] = []
+        # (guardrail名, 出力のダイジェスト) -> validate結果 のLRU
+        self._result_cache: OrderedDict = OrderedDict()
+
+    def _cached_validate(
+        self, name: str, validate_fn: Callable, output: str
+    ) -> Dict[str, Any]:
+        key = (name, blake2b(output.encode()).digest())
+        cache = self._result_cache
+        result = cache.get(key)
+        if result is None:
+            result = validate_fn(output)
+            cache[key] = result
+            if len(cache) > _RESULT_CACHE_SIZE:
+                cache.popitem(last=False)
+        else:
+            cache.move_to_end(key)
+        return result
+
+    def register(self, guardrail: Guardrail) -> None:
+        if guardrail.name in self._guardrails:
+            # 再登録は適用順を保ったままboundメソッドを差し替える
+            index = self._names.index(guardrail.name)
+            self._validate_fns[index] = guardrail.validate
+            self._fix_fns[index] = guardrail.fix
+            # キャッシュキーはguardrail名ベースなので、差し替え前の判定が
+            # 残らないようvalidate結果のキャッシュを破棄する
+            self._result_cache.clear()
+        else:
+            self._names.append(guardrail.name)
+            self._validate_fns.append(guardrail.validate)
+            self._fix_fns.append(guardrail.fix)
+        self._guardrails[guardrail.name] = guardrail
+
+    def get(self, name: str) -> Optional[Guardrail]:
+        return self._guardrails.get(name)
+
+    def __getitem__(self, name: str) -> Guardrail:
+        return self._guardrails[name]
+
+    def __iter__(self):
+        return iter(self._guardrails.values())
+
+    def all(self):
+        """登録済みguardrailのビューを返す。リストを作らないのでイテレートは無コピー"""
+        return self._guardrails.values()
+
+    def apply_all(self, output: str) -> str:
+        """
+        Validate with every guardrail in order, fixing when needed.
+        """
+        current_output = output
+        for name, validate_fn, fix_fn in zip(
+            self._names, self._validate_fns, self._fix_fns
+        ):
+            result = self._cached_validate(name, validate_fn, current_output)
+            if not result["valid"]:
+                current_output = fix_fn(current_output, result["issues"])
+        return current_output
+
+    def apply_all_batch(self, outputs: List[str]) -> List[str]:
+        """
+        Apply every guardrail to a batch of outputs.
+
+        guardrailを外側ループにすることで、validate_batchを持つguardrailは
+        バッチ全体を1回の走査で処理できる。
+        """
+        current_outputs = list(outputs)
+        for guardrail in self._guardrails.values():
+            results = guardrail.validate_batch(current_outputs)
+            current_outputs = guardrail.fix_batch(current_outputs, results)
+        return current_outputs
+
+    async def apply_all_async(self, output: str, max_parallel: int = 5) -> str:
+        """
+        Async apply_all that runs all validations concurrently.
+
+        validateはoutputに対して独立なのでsemaphoreで束ねて並列実行し、
+        問題が見つかったguardrailのfixだけを登録順に逐次適用する。
+        """
+        semaphore = asyncio.Semaphore(max_parallel)
+
+        async def run_validate(guardrail):
+            async with semaphore:
+                return await guardrail.avalidate(output)
+
+        guardrails = list(self._guardrails.values())
+        results = await asyncio.gather(*(run_validate(g) for g in guardrails))
+        current_output = output
+        for guardrail, result in zip(guardrails, results):
+            if not result["valid"]:
+                current_output = await guardrail.afix(current_output, result["issues"])
+        return current_output
@@ -0,0 +1,129 @@
+"""
+Tools that nodes can expose to an LLM.
+
+A tool wraps a python callable with the name/description/parameter metadata
+providers expect. Tools live in a ToolRegistry, whose dict form is sent to
+the LLM on every agent turn.
+"""
+
+import json
+from typing import Any, Callable, Dict, List, Optional
+
+try:
+    import orjson  # あれば高速なJSONシリアライザを使う
+except ImportError:
+    orjson = None
+
+
+def _dump_json_bytes(obj: Any) -> bytes:
+    return orjson.dumps(obj) if orjson is not None else json.dumps(obj).encode("utf-8")
+
+
+class Tool:
+    """
+    Base class wrapping a callable with tool metadata.
+    """
+
+    __slots__ = ("name", "description", "function", "_cached_dict", "_cached_json")
+
+    def __init__(self, name: str, description: str, function: Callable) -> None:
+        self.name = name
+        self.description = description
+        self.function = function
+        # メタデータは不変なので、dict/JSONを構築時に1度だけ作って使い回す。
+        # 返り値は共有オブジェクトなので呼び出し側で変更しないこと
+        self._cached_dict = {"name": name, "description": description}
+        self._cached_json = _dump_json_bytes(self._cached_dict)
+
+    def __call__(self, *args, **kwargs):
+        return self.function(*args, **kwargs)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Returns the provider-facing description of this tool.
+        """
+        return self._cached_dict
+
+    def to_json_bytes(self) -> bytes:
+        """
+        Returns to_dict() pre-serialized as JSON bytes.
+        """
+        return self._cached_json
+
+
+class JSONSchemaTool(Tool):
+    """
+    Tool whose arguments are described by a JSON schema.
+    """
+
+    __slots__ = ("parameters",)
+
+    def __init__(
+        self,
+        name: str,
+        description: str,
+        function: Callable,
+        parameters: Dict[str, Any],
+    ) -> None:
+        super().__init__(name, description, function)
+        self.parameters = parameters
+        self._cached_dict = {
+            "name": name,
+            "description": description,
+            "parameters": parameters,
+        }
+        self._cached_json = _dump_json_bytes(self._cached_dict)
+
+
+class ToolRegistry:
+    """
+    Named collection of tools.
+    """
+
+    __slots__ = ("_tools", "_dict_list_cache", "_json_bytes_cache")
+
+    def __init__(self) -> None:
+        self._tools: Dict[str, Tool] = {}
+        # to_dict_listはLLM呼び出しごとに使われるので結果をキャッシュする
+        self._dict_list_cache: Optional[List[Dict[str, Any]]] = None
+        self._json_bytes_cache: Optional[bytes] = None
+
+    def register(self, tool: Tool) -> None:
+        self._tools[tool.name] = tool
+        # 登録でキャッシュを無効化する
+        self._dict_list_cache = None
+        self._json_bytes_cache = None
+
+    def get(self, name: str) -> Optional[Tool]:
+        return self._tools.get(name)
+
+    def __getitem__(self, name: str) -> Tool:
+        return self._tools[name]
+
+    def __iter__(self):
+        return iter(self._tools.values())
+
+    def all(self):
+        """登録済みツールのビューを返す。リストを作らないのでイテレートは無コピー"""
+        return self._tools.values()
+
+    def to_dict_list(self) -> List[Dict[str, Any]]:
+        """
+        Returns the provider-facing descriptions of all tools.
+
+        ツールは登録後ほぼ不変なので、registerされるまで同じリストを返す。
+        """
+        if self._dict_list_cache is None:
+            self._dict_list_cache = [tool.to_dict() for tool in self._tools.values()]
+        return self._dict_list_cache
+
+    def to_dict_list_json_bytes(self) -> bytes:
+        """
+        Returns to_dict_list() pre-serialized as JSON bytes.
+
+        Transports that send the tool payload verbatim can skip re-encoding
+        it on every turn.
+        """
+        if self._json_bytes_cache is None:
+            self._json_bytes_cache = _dump_json_bytes(self.to_dict_list())
+        return self._json_bytes_cache
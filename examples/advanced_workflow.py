@@ -0,0 +1,170 @@
+"""
+Advanced workflow example.
+
+Runs a research pipeline (research -> summary -> analysis -> report) on a
+MockLLM so the example works without API keys. The analysis stage runs the
+two summary consumers (insights / recommendations) concurrently instead of
+in sequence.
+"""
+
+import asyncio
+import logging
+import re
+import sys
+
+from agent_workflow_framework import AgentNode, NodeState
+from agent_workflow_framework.core.graphs.networks import SequentialWorkflow
+
+from .utils import CachedLLMMixin, run_sync
+
+logger = logging.getLogger(__name__)
+
+
+class MockLLM(CachedLLMMixin):
+    """
+    Stand-in LLM that answers from canned responses.
+
+    実APIを呼ばずに例を動かすための代替実装。invoke/ainvokeの形は
+    実プロバイダのモデルと揃えてあり、同一プロンプトは応答キャッシュから返る。
+    """
+
+    # リテラルごとにin検査でプロンプト全体を走査し直さないよう、
+    # 1本の選択肢パターンで1パス走査して応答表を引く
+    _DISPATCH = re.compile(
+        r"(research about|summarize|extract key insights"
+        r"|create recommendations|format as report)",
+        re.IGNORECASE,
+    )
+    _RESPONSES = {
+        "research about": "Mock research data: three key papers and two surveys found.",
+        "summarize": "Mock summary: the field is converging on graph-based agents.",
+        "extract key insights": "Mock insights: orchestration and caching dominate latency.",
+        "create recommendations": "Mock recommendations: parallelize independent LLM calls.",
+        "format as report": "Mock final report: see sections above.",
+    }
+
+    def _complete(self, prompt: str) -> str:
+        m = self._DISPATCH.search(prompt)
+        return self._RESPONSES[m.group(1).lower()] if m else "Mock response."
+
+
+class ResearchState(NodeState):
+    topic: str  # 調査対象のトピック
+    research_data: str = ""  # 調査結果
+    summary: str = ""  # 要約
+    key_insights: str = ""  # 要点
+    recommendations: str = ""  # 提言
+    final_report: str = ""  # 最終レポート
+
+
+class ResearchNode(AgentNode[ResearchState]):
+    name = "researcher"
+    instruction = "research about the topic"
+
+    def proc(self, state: ResearchState) -> ResearchState:
+        state.research_data = self.run_with_instruction(state.topic)
+        return state
+
+
+class SummaryNode(AgentNode[ResearchState]):
+    name = "summarizer"
+    instruction = "summarize the research data"
+
+    def proc(self, state: ResearchState) -> ResearchState:
+        state.summary = self.run_with_instruction(state.research_data)
+        return state
+
+
+class InsightsNode(AgentNode[ResearchState]):
+    name = "insights extractor"
+    instruction = "extract key insights from the summary"
+
+    async def aproc(self, state: ResearchState) -> ResearchState:
+        state.key_insights = await self.llm.ainvoke(
+            f"{self.instruction}:\n{state.summary}"
+        )
+        return state
+
+    def proc(self, state: ResearchState) -> ResearchState:
+        # ループを毎回作り直さず、常駐ループ上で実行する
+        return run_sync(self.aproc(state))
+
+
+class RecommendationsNode(AgentNode[ResearchState]):
+    name = "recommendations creator"
+    instruction = "create recommendations from the summary"
+
+    async def aproc(self, state: ResearchState) -> ResearchState:
+        state.recommendations = await self.llm.ainvoke(
+            f"{self.instruction}:\n{state.summary}"
+        )
+        return state
+
+    def proc(self, state: ResearchState) -> ResearchState:
+        # ループを毎回作り直さず、常駐ループ上で実行する
+        return run_sync(self.aproc(state))
+
+
+class ParallelAnalysisNode(AgentNode[ResearchState]):
+    """
+    Runs the insights and recommendations nodes concurrently.
+
+    両ノードともsummaryしか読まず、書き込み先フィールドも互いに素なので、
+    LLM待ちをgatherで重ねて解析ステージの実時間をほぼ半分にできる。
+    """
+
+    name = "parallel analysis"
+
+    def __init__(self, llm) -> None:
+        super().__init__(llm)
+        self.insights = InsightsNode(llm)
+        self.recommendations = RecommendationsNode(llm)
+
+    async def aproc(self, state: ResearchState) -> ResearchState:
+        await asyncio.gather(
+            self.insights.aproc(state), self.recommendations.aproc(state)
+        )
+        return state
+
+    def proc(self, state: ResearchState) -> ResearchState:
+        # ループを毎回作り直さず、常駐ループ上で実行する
+        return run_sync(self.aproc(state))
+
+
+class ReportFormatterNode(AgentNode[ResearchState]):
+    name = "report formatter"
+    instruction = "format as report"
+
+    def proc(self, state: ResearchState) -> ResearchState:
+        # 長文フィールドを連結で継ぎ足さず、joinで合計サイズ1回のコピーにする
+        parts = (
+            "Topic: " + state.topic,
+            "Summary: " + state.summary,
+            "Key Insights: " + state.key_insights,
+            "Recommendations: " + state.recommendations,
+        )
+        state.final_report = self.run_with_instruction("\n\n".join(parts))
+        return state
+
+
+def main():
+    # ハンドラのインストールはスクリプト実行時のみ。モジュールとしてimportされた場合
+    # （テストやドキュメント生成）にはロギング設定を汚さない
+    logging.basicConfig(level=logging.INFO, stream=sys.stdout)
+    llm = MockLLM()
+    workflow = SequentialWorkflow(
+        [
+            ResearchNode(llm),
+            SummaryNode(llm),
+            ParallelAnalysisNode(llm),
+            ReportFormatterNode(llm),
+        ],
+        ResearchState,
+    )
+    app = workflow.get_app()
+    result = app.invoke({"topic": "AI agent frameworks"})
+    logger.info("final report:\n%s", result["final_report"])
+
+
+if __name__ == "__main__":
+    main()
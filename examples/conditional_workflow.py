@@ -0,0 +1,127 @@
+"""
+Conditional workflow example.
+
+An analyzer labels the content SIMPLE or COMPLEX and the workflow routes it
+to the matching processor. Runs on a MockLLM so the example works without
+API keys.
+"""
+
+import logging
+import re
+import sys
+
+from agent_workflow_framework import AgentNode, NodeState
+from agent_workflow_framework.core.graphs.networks import ConditionalWorkflow
+
+from .utils import CachedLLMMixin
+
+logger = logging.getLogger(__name__)
+
+
+class MockLLM(CachedLLMMixin):
+    """実APIを呼ばずに例を動かすための代替LLM。同一プロンプトはキャッシュから返る"""
+
+    # リテラルごとにin検査せず、1本の選択肢パターンで1パス走査して
+    # マッチしたリテラルに対応するハンドラを引く
+    _DISPATCH = re.compile(
+        r"(classify the complexity|process the simple content"
+        r"|process the complex content)",
+        re.IGNORECASE,
+    )
+    _HANDLERS = {
+        "classify the complexity": (
+            lambda prompt: "COMPLEX" if "graph" in prompt else "SIMPLE"
+        ),
+        "process the simple content": lambda prompt: "Mock simple result.",
+        "process the complex content": (
+            lambda prompt: "Mock complex result: broken into sub-problems."
+        ),
+    }
+
+    def _complete(self, prompt: str) -> str:
+        m = self._DISPATCH.search(prompt)
+        return self._HANDLERS[m.group(1).lower()](prompt) if m else "Mock response."
+
+
+class ContentState(NodeState):
+    content: str  # 入力コンテンツ
+    complexity: str = ""  # SIMPLE / COMPLEX
+    result: str = ""  # 処理結果
+
+
+class ComplexityAnalyzerNode(AgentNode[ContentState]):
+    name = "complexity analyzer"
+    instruction = "classify the complexity"
+
+    def proc(self, state: ContentState) -> ContentState:
+        state.complexity = self.llm.invoke(f"{self.instruction}:\n{state.content}")
+        return state
+
+
+class SimpleProcessorNode(AgentNode[ContentState]):
+    name = "simple processor"
+    instruction = "process the simple content"
+
+    def proc(self, state: ContentState) -> ContentState:
+        state.result = self.llm.invoke(f"{self.instruction}:\n{state.content}")
+        return state
+
+
+class ComplexProcessorNode(AgentNode[ContentState]):
+    name = "complex processor"
+    instruction = "process the complex content"
+
+    def proc(self, state: ContentState) -> ContentState:
+        state.result = self.llm.invoke(f"{self.instruction}:\n{state.content}")
+        return state
+
+
+# 遷移ごとの比較連鎖を避け、ルーティング表を1回のdict参照で引く
+_ROUTES = {"SIMPLE": "simple", "COMPLEX": "complex"}
+
+
+def complexity_condition(state: ContentState) -> str:
+    return "error" if state.error else _ROUTES.get(state.complexity, "error")
+
+
+def _finish(state: ContentState) -> str:
+    return "done"
+
+
+def main():
+    # ハンドラのインストールはスクリプト実行時のみ。モジュールとしてimportされた場合
+    # （テストやドキュメント生成）にはロギング設定を汚さない
+    logging.basicConfig(level=logging.INFO, stream=sys.stdout)
+    llm = MockLLM()
+    analyzer = ComplexityAnalyzerNode(llm)
+    simple_processor = SimpleProcessorNode(llm)
+    complex_processor = ComplexProcessorNode(llm)
+
+    conditional_edges = {
+        analyzer.node_name: {
+            "condition": complexity_condition,
+            "destinations": {
+                "simple": simple_processor.node_name,
+                "complex": complex_processor.node_name,
+                "error": "end",
+            },
+        },
+        # simple側で処理した場合はそのまま終了する
+        simple_processor.node_name: {
+            "condition": _finish,
+            "destinations": {"done": "end"},
+        },
+    }
+
+    workflow = ConditionalWorkflow(
+        [analyzer, simple_processor, complex_processor],
+        ContentState,
+        conditional_edges,
+    )
+    app = workflow.get_app()
+    result = app.invoke({"content": "A short note about graph-based agents."})
+    logger.info("result: %s", result["result"])
+
+
+if __name__ == "__main__":
+    main()
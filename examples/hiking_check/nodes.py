@@ -4,7 +4,7 @@ from langgraph.prebuilt import create_react_agent
 
 from agent_workflow_framework import AgentNode, PromptManager, ProviderType
 
-from ..utils import extract_last_content_without_think, pick
+from ..utils import extract_last_content_without_think, make_picker, make_validator
 from .states import HikingCheckState as TState
 from .states import input_keys, output_key
 from .tools import tool_repository
@@ -31,23 +31,30 @@ content = [
 ]
 prompt_[ProviderType.GOOGLE.value] = content
 
+_validate_inputs = make_validator(input_keys)
+_pick_inputs = make_picker(input_keys)
+
 
 # define node
 class HikingCheck(AgentNode[TState]):
     name = "hiking check"
 
+    def __init__(self, llm) -> None:
+        super().__init__(llm)
+        # create_react_agentはグラフ構築とツールbindを伴うため、
+        # 呼び出しごとに組み立てず構築時に1度だけchainを作る。
+        # プロバイダ選択（property参照+dict参照）もここで解決しておく
+        self._chain = (
+            RunnableLambda(_pick_inputs)
+            | prompt_[self.llm.provider_name]
+            | create_react_agent(self.llm, tool_repository)
+            | extract_last_content_without_think
+        )
+
     def validate(self, state: TState) -> None:
-        for k in input_keys:
-            if not (hasattr(state, k) and getattr(state, k)):
-                raise Exception(f"{k}が入力されていません。")
+        _validate_inputs(state)
 
     def proc(self, state: TState) -> TState:
         """都市名から情報を得て結果を出力"""
-        chain = (
-            RunnableLambda(lambda x: pick(x, input_keys))
-            | prompt_
-            | create_react_agent(self.llm, tool_repository.values())
-            | extract_last_content_without_think
-        )
-        setattr(state, output_key, chain.invoke(state))
+        setattr(state, output_key, self._chain.invoke(state))
         return state
@@ -13,6 +13,11 @@ def get_templature(city: str) -> str:
     return "摂氏25度"
 
 
-tool_repository = dict()
-tool_repository[get_weather.name] = get_weather
-tool_repository[get_templature.name] = get_templature
+# 消費側（create_react_agent）はiterableを受け取るだけなので、
+# ハッシュ化もバケット確保も不要な不変のタプルで持つ
+tool_repository = (get_weather, get_templature)
+
+
+def tool_by_name():
+    """名前引きが必要な場合にだけ辞書を作る"""
+    return {t.name: t for t in tool_repository}
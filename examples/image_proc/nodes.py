@@ -1,16 +1,12 @@
-from langchain_core.output_parsers.string import StrOutputParser
+import asyncio
 
-LANGCHAIN_MAX_CONCURRENCY = 2
 from langchain_core.messages import HumanMessage
-from langchain_core.runnables import (
-    RunnableLambda,
-    RunnableParallel,
-    RunnablePassthrough,
-    RunnablePick,
-)
+from langchain_core.output_parsers.string import StrOutputParser
+from langchain_core.runnables import RunnableLambda
 
 from agent_workflow_framework import AgentNode, PromptManager, ProviderType
 
+from ..utils import make_validator
 from .states import ImageProcState
 from .states import ImageProcState as TState
 from .states import input_keys, output_key
@@ -79,6 +75,18 @@ content = [
 prompt_[ProviderType.GOOGLE.value] = content
 prompt_.append_attach_key("img_data")
 
+_validate_inputs = make_validator(input_keys)
+
+# StrOutputParserは状態を持たないので、ノードインスタンスごとに作らず共有する
+_STR_PARSER = StrOutputParser()
+
+
+def _explode_images(state):
+    """stateの画像リストを画像ごとの入力dictに展開する"""
+    return [
+        {"image_idx": i, "file_path": p} for i, p in enumerate(state.images, 1)
+    ]
+
 
 # define node
 
@@ -86,34 +94,43 @@ prompt_.append_attach_key("img_data")
 class ProcessImages(AgentNode[ImageProcState]):
     name = "process images"
 
+    def __init__(self, llm, max_concurrency: int = 8) -> None:
+        super().__init__(llm)
+        # リモートLLMへの同時リクエスト数。プロバイダのレート制限に合わせて調整する
+        self.max_concurrency = max_concurrency
+        # chainはstateに依存しないので、呼び出しごとに組み立てず構築時に確定する。
+        # closureが画像ごとに属性を読み直さないようローカルに束縛しておく
+        llm_ = self.llm
+        analysis_chain = prompt_[llm_.provider_name] | llm_ | _STR_PARSER
+
+        # 画像の読み込み・解析・整形を1関数に融合し、Passthrough.assign /
+        # RunnablePickが画像ごとに行っていたdictコピー3回とrunnableホップを省く
+        def _run_one(item):
+            img = llm_.get_image_object(item["file_path"])  # _attach_ DSL
+            analysis = analysis_chain.invoke({**item, "_attach_img_data": img})
+            return {"image_idx": item["image_idx"], "analysis": analysis}
+
+        async def _arun_one(item):
+            # 画像読み込みはスレッドに逃がし、進行中のLLMリクエストと重ねる
+            img = await asyncio.to_thread(llm_.get_image_object, item["file_path"])
+            analysis = await analysis_chain.ainvoke({**item, "_attach_img_data": img})
+            return {"image_idx": item["image_idx"], "analysis": analysis}
+
+        self._chain = RunnableLambda(_run_one, afunc=_arun_one)
+
     def validate(self, state: TState) -> None:
-        for k in input_keys:
-            if not (hasattr(state, k) and getattr(state, k)):
-                raise Exception(f"{k}が入力されていません。")
+        _validate_inputs(state)
+
+    async def aproc(self, state: ImageProcState) -> ImageProcState:
+        """複数の画像を非同期に処理して内容を抽出"""
+        inputs = _explode_images(state)
+        # I/O待ちが支配的なのでイベントループ上で同時に投げる
+        results = await self._chain.abatch(
+            inputs, config={"max_concurrency": self.max_concurrency}
+        )
+        setattr(state, output_key, results)
+        return state
 
     def proc(self, state: ImageProcState) -> ImageProcState:
         """複数の画像を処理して内容を抽出"""
-        chain = RunnableLambda(
-            lambda x: [
-                {"image_idx": idx + 1, "file_path": image}
-                for idx, image in enumerate(x.images)
-            ]
-        ) | RunnableLambda(  # 画像リストを取得
-            (
-                RunnablePassthrough.assign(
-                    _attach_img_data=lambda x: self.llm.get_image_object(
-                        x["file_path"]
-                    )  # _attach_ DSL
-                )
-                | RunnablePassthrough.assign(
-                    analysis=(
-                        prompt_[self.llm.provider_name] | self.llm | StrOutputParser()
-                    ),
-                )
-                | RunnablePick(["image_idx", "analysis"])
-            ).batch
-        ).with_config(
-            {"max_concurrency": LANGCHAIN_MAX_CONCURRENCY}
-        )
-        setattr(state, output_key, chain.invoke(state))
-        return state
+        return asyncio.run(self.aproc(state))
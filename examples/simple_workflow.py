@@ -0,0 +1,60 @@
+"""
+Simple workflow example.
+
+Summarizes a document with a single node on a MockLLM, so the example works
+without API keys.
+"""
+
+import logging
+import re
+import sys
+
+from agent_workflow_framework import AgentNode, NodeState
+from agent_workflow_framework.core.graphs.networks import SequentialWorkflow
+
+from .utils import CachedLLMMixin
+
+logger = logging.getLogger(__name__)
+
+
+class MockLLM(CachedLLMMixin):
+    """実APIを呼ばずに例を動かすための代替LLM。同一プロンプトはキャッシュから返る"""
+
+    # リテラルごとにin検査せず、1本の選択肢パターンで1パス走査する
+    _DISPATCH = re.compile(r"(summarize)", re.IGNORECASE)
+    _RESPONSES = {
+        "summarize": "Mock summary: the document describes an agent workflow.",
+    }
+
+    def _complete(self, prompt: str) -> str:
+        m = self._DISPATCH.search(prompt)
+        return self._RESPONSES[m.group(1).lower()] if m else "Mock response."
+
+
+class DocumentState(NodeState):
+    document: str  # 入力文書
+    summary: str = ""  # 要約
+
+
+class DocumentProcessor(AgentNode[DocumentState]):
+    name = "document processor"
+    instruction = "summarize the document"
+
+    def proc(self, state: DocumentState) -> DocumentState:
+        state.summary = self.llm.invoke(f"{self.instruction}:\n{state.document}")
+        return state
+
+
+def main():
+    # ハンドラのインストールはスクリプト実行時のみ。モジュールとしてimportされた場合
+    # （テストやドキュメント生成）にはロギング設定を汚さない
+    logging.basicConfig(level=logging.INFO, stream=sys.stdout)
+    llm = MockLLM()
+    workflow = SequentialWorkflow([DocumentProcessor(llm)], DocumentState)
+    app = workflow.get_app()
+    result = app.invoke({"document": "Agent workflows wire LLM nodes into graphs."})
+    logger.info("summary: %s", result["summary"])
+
+
+if __name__ == "__main__":
+    main()
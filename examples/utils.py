@@ -1,4 +1,9 @@
+import asyncio
+import operator
 import re
+import threading
+from collections import OrderedDict
+from hashlib import blake2b
 
 from langchain_core.output_parsers import StrOutputParser
 from langchain_core.runnables import RunnableLambda
@@ -9,15 +14,125 @@ def pick(state, key_list):
     return {k: getattr(state, k) for k in key_list}
 
 
+# 常駐イベントループ。呼び出しごとのasyncio.runはループを破棄するため、
+# MCP接続やHTTPプールなどの非同期リソースを使い回せない
+_loop = None
+_loop_lock = threading.Lock()
+
+
+def get_event_loop() -> asyncio.AbstractEventLoop:
+    """プロセスで共有するバックグラウンドループを返す（初回に起動する）"""
+    global _loop
+    with _loop_lock:
+        if _loop is None:
+            _loop = asyncio.new_event_loop()
+            thread = threading.Thread(
+                target=_loop.run_forever, name="awf-examples-loop", daemon=True
+            )
+            thread.start()
+        return _loop
+
+
+def run_sync(coro):
+    """常駐ループ上でコルーチンを実行し、結果を同期的に返す"""
+    return asyncio.run_coroutine_threadsafe(coro, get_event_loop()).result()
+
+
+def make_picker(keys):
+    """
+    Build a pick function pre-bound to the given keys.
+
+    呼び出しごとのgetattrディスパッチを避け、C実装のattrgetter1回で
+    値を取り出してdictに詰める。
+    """
+    getter = operator.attrgetter(*keys)
+    if len(keys) == 1:
+        key = keys[0]
+        return lambda state: {key: getter(state)}
+    return lambda state: dict(zip(keys, getter(state)))
+
+
+def make_validator(keys):
+    """
+    Build a validate function for the given input keys.
+
+    NodeStateのフィールドは必ず存在するのでhasattrは不要。C実装の
+    attrgetterで一括取得し、単一キーの場合はループも省いた直接参照にする。
+    """
+    if len(keys) == 1:
+        key = keys[0]
+        getter = operator.attrgetter(key)
+
+        def validate(state):
+            if not getter(state):
+                raise Exception(f"{key}が入力されていません。")
+
+        return validate
+
+    getter = operator.attrgetter(*keys)
+
+    def validate(state):
+        missing = [k for k, v in zip(keys, getter(state)) if not v]
+        if missing:
+            raise Exception(f"{'、'.join(missing)}が入力されていません。")
+
+    return validate
+
+
+class CachedLLMMixin:
+    """
+    Prompt-keyed LRU response cache for the example LLMs.
+
+    ワークフローのリプレイやテストループでは同一プロンプトでの再呼び出しが
+    多いため、プロンプトのダイジェストをキーに応答を再利用してモデル実行を
+    省略する。サブクラスは_complete(prompt)に実際の生成処理を実装する。
+    確率的なリトライなどはcache_bypass=Trueでキャッシュを迂回できる。
+    """
+
+    _cache_size = 1024
+
+    def _complete(self, prompt: str) -> str:
+        raise NotImplementedError
+
+    def invoke(self, prompt: str, cache_bypass: bool = False) -> str:
+        if cache_bypass:
+            return self._complete(prompt)
+        try:
+            cache = self._response_cache
+        except AttributeError:
+            cache = self._response_cache = OrderedDict()
+        key = blake2b(prompt.encode(), digest_size=16).digest()
+        response = cache.get(key)
+        if response is None:
+            response = self._complete(prompt)
+            cache[key] = response
+            if len(cache) > self._cache_size:
+                cache.popitem(last=False)
+        else:
+            cache.move_to_end(key)
+        return response
+
+    async def ainvoke(self, prompt: str, cache_bypass: bool = False) -> str:
+        """invokeの非同期版。ブロッキング実装をスレッドに逃がす"""
+        return await asyncio.to_thread(self.invoke, prompt, cache_bypass)
+
+
+# メッセージごとにパターンを組み立て直さないよう先にコンパイルしておく。
+# 属性付きタグや閉じタグ前の空白も許容し、非貪欲なので後戻りは伸びない
+_THINK_RE = re.compile(r"<think\b[^>]*>.*?</think\s*>\s*", re.DOTALL)
+
+
+def _strip_think(text: str) -> str:
+    # <think>を含まない通常ケースはC実装の部分文字列検索だけで済ませ、
+    # 正規表現エンジンを起動しない
+    if "<think" in text:
+        return _THINK_RE.sub("", text, count=1).strip()
+    return text.strip()
+
+
 extract_last_content_without_think = (
     RunnablePick("messages")
     | RunnableLambda(lambda msgs: msgs[-1])
     | StrOutputParser()
-    | RunnableLambda(
-        lambda text: re.search(
-            r"(?:<think>.*</think>)?(.*)", text, flags=re.MULTILINE | re.DOTALL
-        )
-        .group(1)
-        .strip()
-    )
+    | RunnableLambda(_strip_think)
 )
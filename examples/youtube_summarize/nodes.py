@@ -1,24 +1,30 @@
 import asyncio
+import re
+import time
+from collections import OrderedDict
 
 from langchain_core.messages import HumanMessage
 from langchain_core.runnables import RunnableLambda
-from langchain_mcp_adapters.client import MultiServerMCPClient
 from langgraph.prebuilt import create_react_agent
 
 from agent_workflow_framework import AgentNode, PromptManager, ProviderType
 
-from ..utils import extract_last_content_without_think, pick
-from .mcp_config import mcp_config
+from ..utils import extract_last_content_without_think, make_picker
+from .session import run_sync, session
 from .states import YoutubeSummarizeState as TState
 from .states import input_keys, output_key
 
 # define promot
+# 静的な指示プレフィックスと動的なURL末尾を別ブロックに分ける。
+# 静的部分はバイト単位で毎回同一になるので、プロバイダ側の
+# プロンプトキャッシュが効く（静的を先頭、動的を末尾に置く）
 instruction = """
 あなたはyoutubeの動画の要約をするエージェントです。
 ユーザーから与えられる情報に応じて**日本語で**答えてください。
 ALWAYS respond to users in Japanese. Responding in English is PROHIBITED
-チェック対象の動画は {url} です。
 """
+url_suffix = "チェック対象の動画は {url} です。"
+
 prompt_name = "youtube_summarize_prompt"
 
 prompt_ = PromptManager(prompt_name)
@@ -28,33 +34,169 @@ content = [
             {
                 "type": "text",
                 "text": instruction,
-            }
+            },
+            {
+                "type": "text",
+                "text": url_suffix,
+            },
         ]
     )
 ]
 prompt_[ProviderType.GOOGLE.value] = content
+# Anthropicは静的ブロックにcache_controlを付けるとサーバ側で
+# プレフィックスのKVキャッシュが再利用される
+content_anthropic = [
+    HumanMessage(
+        content=[
+            {
+                "type": "text",
+                "text": instruction,
+                "cache_control": {"type": "ephemeral"},
+            },
+            {
+                "type": "text",
+                "text": url_suffix,
+            },
+        ]
+    )
+]
+prompt_[ProviderType.ANTHROPIC.value] = content_anthropic
+
+# input_keysは固定なので、呼び出しごとのキー走査をattrgetter1回に特殊化する
+_pick_inputs = make_picker(input_keys)
+
+# youtu.be / shorts / m.youtube.com などの表記ゆれを動画IDで正規化し、
+# 応答キャッシュとプロバイダ側プロンプトキャッシュの完全一致率を上げる
+_VIDEO_ID_RE = re.compile(r"(?:v=|youtu\.be/|shorts/|embed/)([A-Za-z0-9_-]{11})")
+
+
+def _canonicalize_url(url: str) -> str:
+    m = _VIDEO_ID_RE.search(url)
+    if m is None:
+        return url
+    return f"https://www.youtube.com/watch?v={m.group(1)}"
+
+# 固定の動画に対する要約は決定的なので、同一URLの再要約では
+# ReActループ（トランスクリプト取得＋複数LLM呼び出し）を丸ごと省く
+_SUMMARY_CACHE_SIZE = 256
+_SUMMARY_TTL = 24 * 60 * 60  # 秒
+_summary_cache = OrderedDict()  # url -> (期限, 要約)
+
+
+def _cache_get(url):
+    entry = _summary_cache.get(url)
+    if entry is None:
+        return None
+    expires_at, summary = entry
+    if time.monotonic() > expires_at:
+        del _summary_cache[url]
+        return None
+    _summary_cache.move_to_end(url)
+    return summary
+
+
+def _cache_set(url, summary):
+    _summary_cache[url] = (time.monotonic() + _SUMMARY_TTL, summary)
+    if len(_summary_cache) > _SUMMARY_CACHE_SIZE:
+        _summary_cache.popitem(last=False)
 
 
 # define node
 class YoutubeSummarize(AgentNode[TState]):
     name = "hiking check"
 
+    def __init__(self, llm) -> None:
+        super().__init__(llm)
+        # create_react_agentのグラフcompileはMCPツールが揃ってからなので、
+        # chainは初回のaprocで1度だけ組み立ててから使い回す
+        self._chain = None
+        self._chain_lock = asyncio.Lock()
+
+    async def _get_chain(self):
+        """初回のみツール取得とグラフ構築を行い、以後はキャッシュを返す"""
+        if self._chain is None:
+            async with self._chain_lock:
+                if self._chain is None:
+                    # 接続済みセッションのキャッシュ済みツール一覧を使う。
+                    # MCPのハンドシェイクとlist-toolsは初回だけになる
+                    tools = await session.tools()
+                    llm = self.llm
+                    if getattr(llm, "provider_name", None) in ("openai", "lmstudio"):
+                        # 1ターン内の独立したツール呼び出し（トランスクリプト・
+                        # メタデータ等）を逐次でなく同時に発行させる
+                        llm = llm.bind_tools(tools, parallel_tool_calls=True)
+                    self._chain = (
+                        RunnableLambda(_pick_inputs)
+                        # 構築時にプロバイダを解決しておく。素のprompt_だと
+                        # default_key（最初に登録したgoogle）のまま描画され、
+                        # Anthropic用のcache_control付きテンプレートに届かない
+                        | prompt_[self.llm.provider_name]
+                        | create_react_agent(llm, tools)
+                        | extract_last_content_without_think
+                    )
+        return self._chain
+
     def validate(self, state: TState) -> None:
         for k in input_keys:
             if not (hasattr(state, k) and getattr(state, k)):
                 raise Exception(f"{k}が入力されていません。")
+        # 同一動画の別表記が別キャッシュキーにならないよう、ここで正規化する
+        state.url = _canonicalize_url(state.url)
+
+    async def astream_proc(self, state: TState):
+        """
+        要約をチャンク単位でyieldする。
+
+        チャンクの粒度は下流の変換がストリーミングに対応しているかに依存する。
+        現状はextract_last_content_without_think内のmsgs[-1]を取るLambdaが
+        入力全体をバッファするため、実際には完成した要約が1チャンクで届く。
+        完走後はstateに全文を書き戻す。
+        """
+        # abatch/aprocはvalidateを通らず直接ここに来るので、キャッシュ参照と
+        # プロンプト描画の前にURL正規化をかけ直す（validate経由なら冪等）
+        state.url = _canonicalize_url(state.url)
+        cached = _cache_get(state.url)
+        if cached is not None:
+            setattr(state, output_key, cached)
+            yield cached
+            return
+        chain = await self._get_chain()
+        buffer = []
+        async for chunk in chain.astream(state):
+            buffer.append(chunk)
+            yield chunk
+        summary = "".join(buffer)
+        _cache_set(state.url, summary)
+        setattr(state, output_key, summary)
 
     async def aproc(self, state: TState) -> TState:
-        async with MultiServerMCPClient(mcp_config) as mcp_client:
-            chain = (
-                RunnableLambda(lambda x: pick(x, input_keys))
-                | prompt_
-                | create_react_agent(self.llm, mcp_client.get_tools())
-                | extract_last_content_without_think
-            )
-            setattr(state, output_key, await chain.ainvoke(state))
+        # 最終文字列しか要らない場合も内部はastreamで流す。
+        # 非ストリーミングAPIでのプロバイダ側バッファリングを避けられる
+        async for _ in self.astream_proc(state):
+            pass
         return state
 
+    async def abatch(self, states, concurrency: int = 8):
+        """
+        複数のURLを同時に要約する。
+
+        N本を逐次処理するとN×Tの実時間がかかるところを、semaphoreで
+        プロバイダのレート制限内に抑えつつgatherでほぼmax(T)にする。
+        chain・MCPセッションは共有なので各タスクはLLM/ツール待ちのみ。
+        """
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def _one(state):
+            async with semaphore:
+                return await self.aproc(state)
+
+        return await asyncio.gather(*map(_one, states))
+
+    def batch(self, states, concurrency: int = 8):
+        """abatchの同期版"""
+        return run_sync(self.abatch(states, concurrency))
+
     def proc(self, state: TState) -> TState:
         """urlから情報を得て結果を出力"""
-        return asyncio.run(self.aproc(state))
+        # セッションは常駐ループ上に生きているので、同じループで実行する
+        return run_sync(self.aproc(state))
@@ -0,0 +1,99 @@
+"""
+Long-lived event loop and MCP client session shared across invocations.
+
+呼び出しごとに ``async with MultiServerMCPClient(...)`` でハンドシェイクと
+サブプロセス起動をやり直さず、プロセスで1本の常駐ループ上でクライアントを
+開きっぱなしにする。終了時はatexitで同じタスクからクローズする。
+"""
+
+import asyncio
+import atexit
+
+from langchain_mcp_adapters.client import MultiServerMCPClient
+
+from ..utils import get_event_loop, run_sync
+from .mcp_config import mcp_config
+
+__all__ = ["get_event_loop", "run_sync", "session"]
+
+
+class _MCPClientSessionManager:
+    """
+    Keeps one MultiServerMCPClient open for the whole process.
+
+    __aenter__/__aexit__を同一タスク内で行うため、バックグラウンドタスクが
+    コンテキストを保持したままcloseイベントを待つ構成にしている。
+    """
+
+    def __init__(self, config) -> None:
+        self._config = config
+        self._client = None
+        self._tools = None
+        self._lock = asyncio.Lock()
+        self._ready = None
+        self._close_event = None
+        self._task = None
+
+    async def _run(self) -> None:
+        async with MultiServerMCPClient(self._config) as client:
+            self._client = client
+            self._ready.set()
+            await self._close_event.wait()
+        self._client = None
+        # セッションが変わればツール一覧も取り直す
+        self._tools = None
+
+    async def client(self) -> MultiServerMCPClient:
+        """接続済みクライアントを返す（初回のみハンドシェイクが走る）"""
+        if self._client is not None:
+            return self._client
+        async with self._lock:
+            if self._client is None:
+                self._ready = asyncio.Event()
+                self._close_event = asyncio.Event()
+                self._task = asyncio.ensure_future(self._run())
+                # __aenter__が失敗（MCPサーバ不在・設定不備など）すると
+                # readyは永遠に立たないので、タスクの完了も同時に監視して
+                # 失敗は例外として呼び出し元へ伝える
+                ready_task = asyncio.ensure_future(self._ready.wait())
+                try:
+                    await asyncio.wait(
+                        {ready_task, self._task},
+                        return_when=asyncio.FIRST_COMPLETED,
+                    )
+                finally:
+                    ready_task.cancel()
+                if self._task.done() and self._client is None:
+                    # 次回の呼び出しで再接続を試みられるよう状態を戻す
+                    task, self._task = self._task, None
+                    self._ready = None
+                    self._close_event = None
+                    task.result()
+                atexit.register(self.close)
+        return self._client
+
+    async def tools(self):
+        """list-toolsの結果をセッションと同じ寿命でキャッシュして返す"""
+        if self._tools is None:
+            client = await self.client()
+            async with self._lock:
+                if self._tools is None:
+                    self._tools = client.get_tools()
+        return self._tools
+
+    def close(self) -> None:
+        """保持中のセッションを閉じる（atexitから呼ばれる）"""
+        if self._close_event is None or self._task is None:
+            return
+        loop = get_event_loop()
+        loop.call_soon_threadsafe(self._close_event.set)
+        try:
+            asyncio.run_coroutine_threadsafe(
+                asyncio.wait_for(asyncio.shield(self._task), timeout=5.0), loop
+            ).result()
+        except Exception:
+            # 終了処理中の失敗はプロセス終了を妨げない
+            pass
+
+
+session = _MCPClientSessionManager(mcp_config)
@@ -1,6 +1,8 @@
 from agent_workflow_framework import NodeState
 
 
+# NodeState側でvalidate_assignment=False / extra="forbid"を固定しているので、
+# abatchで大量のstateを回しても代入ごとの検証コストはかからない
 class YoutubeSummarizeState(NodeState):
     url: str  # url
     summary: str = ""  # 要約